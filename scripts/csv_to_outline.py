@@ -10,9 +10,214 @@ the documentation synchronization recipe.
 """
 
 import csv
+import functools
 import json
-from datetime import datetime, timezone
+from collections import Counter
+from dataclasses import dataclass, fields, is_dataclass, replace
 from pathlib import Path
+from sys import intern
+from time import gmtime, strftime
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Static lookup tables, built once at import rather than per row
+_VALIDATION_RULES: dict[str, tuple[str, ...]] = {
+    "DIRECT": ("exact_source_match", "format_consistency", "metadata_preserved"),
+    "DERIVED": ("factual_accuracy", "source_traceability", "no_hallucination"),
+    "REFERENCE": ("sources_exist", "links_valid", "refs_current"),
+    "N/A": ("build_passes", "links_valid"),
+}
+
+_TRANSFORM_STEPS: dict[str, tuple[str, ...]] = {
+    "DIRECT": (
+        "copy_content",
+        "add_navigation_header",
+        "update_links",
+        "add_cross_references",
+    ),
+    "DERIVED": (
+        "extract_content",
+        "synthesize_narrative",
+        "add_examples",
+        "add_navigation",
+    ),
+    "REFERENCE": ("verify_sources_exist", "validate_links", "check_version_match"),
+    "N/A": (),
+}
+
+# Category groups used by get_priority()
+_HIGH_PRIORITY_CATEGORIES = frozenset({"architecture", "getting_started", "developer"})
+_MEDIUM_PRIORITY_CATEGORIES = frozenset({"api", "modules"})
+
+# Relationship types whose pages are not regenerated automatically
+_NO_AUTO_UPDATE_TYPES = frozenset({"N/A", "REFERENCE"})
+
+# Source type by file suffix; markdown READMEs are refined to "readme"
+_EXT_TO_TYPE: dict[str, str] = {
+    ".py": "python",
+    ".md": "markdown",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+}
+
+_OUTLINE_META: dict = {
+    "name": "amplifier-docs-content-outline",
+    "version": "1.0.0",
+    "description": "Content synchronization outline for amplifier-docs",
+    "target_site": "https://microsoft.github.io/amplifier-docs/",
+    "generated_from": "docs/DOC_SOURCE_MAPPING.csv",
+    # Filled in per run by transform_csv_to_outline()
+    "generated_at": None,
+    "allowed_repos": None,
+    "github_org": "microsoft",
+    "github_base_url": "https://github.com/microsoft",
+    "relationship_types": {
+        "DIRECT": {
+            "description": "Content closely matches source with minimal transformation",
+            "generation_strategy": "copy_transform",
+            "allows_enhancement": False,
+        },
+        "DERIVED": {
+            "description": "Synthesized from sources, can enhance and adapt",
+            "generation_strategy": "synthesize",
+            "allows_enhancement": True,
+        },
+        "REFERENCE": {
+            "description": "References sources for validation only, not regenerated",
+            "generation_strategy": "validate_only",
+            "allows_enhancement": True,
+        },
+        "N/A": {
+            "description": "Manually maintained, skip generation",
+            "generation_strategy": "skip",
+            "allows_enhancement": True,
+        },
+    },
+    "validation_rule_definitions": {
+        "exact_source_match": {
+            "description": "Core content matches source verbatim (excluding formatting)",
+            "check": "diff_content_normalized",
+        },
+        "format_consistency": {
+            "description": "Markdown formatting follows site standards",
+            "check": "lint_markdown",
+        },
+        "metadata_preserved": {
+            "description": "Source metadata preserved in output",
+            "check": "compare_frontmatter",
+        },
+        "factual_accuracy": {
+            "description": "All facts trace to source material",
+            "check": "source_citation_check",
+        },
+        "source_traceability": {
+            "description": "Each claim can be traced to specific source",
+            "check": "traceability_analysis",
+        },
+        "no_hallucination": {
+            "description": "No invented facts beyond sources",
+            "check": "hallucination_detection",
+        },
+        "sources_exist": {
+            "description": "All referenced source files exist",
+            "check": "file_existence",
+        },
+        "links_valid": {
+            "description": "All internal and external links resolve",
+            "check": "link_validation",
+        },
+        "refs_current": {
+            "description": "Referenced versions match current releases",
+            "check": "version_comparison",
+        },
+        "build_passes": {
+            "description": "Documentation builds without errors",
+            "check": "mkdocs_build_strict",
+        },
+    },
+    "prompt_templates": {
+        "direct_copy": {
+            "description": "Copy with minimal transformation",
+            "template": "Copy the source content. Add navigation header. Update internal links to match site structure. Preserve all technical accuracy.",
+        },
+        "synthesize_architecture": {
+            "description": "Synthesize architecture documentation",
+            "template": "Create architecture documentation by:\n1. Extract core philosophy from design docs\n2. Analyze implementation patterns from code\n3. Synthesize into clear narrative\n4. Add diagrams where helpful\n5. Include practical examples\n\nMaintain factual accuracy - every claim must trace to sources.",
+        },
+        "synthesize_documentation": {
+            "description": "Synthesize general documentation",
+            "template": "Create documentation by synthesizing the source materials:\n1. Extract key concepts and information\n2. Organize in a logical structure\n3. Write clear explanations\n4. Add examples where helpful\n5. Ensure all facts trace to sources",
+        },
+        "module_reference": {
+            "description": "Generate module reference page",
+            "template": "Create module documentation including:\n- Purpose and capabilities\n- Installation instructions\n- Configuration options (from source)\n- Usage examples\n- API reference\n\nVerify all information against README and source code.",
+        },
+        "api_from_docstrings": {
+            "description": "Generate API docs from Python docstrings",
+            "template": "Extract and format API documentation from Python source:\n- Class/function signatures\n- Parameter documentation\n- Return types\n- Usage examples from docstrings\n- Cross-references to related APIs",
+        },
+        "validate_only": {
+            "description": "Validate references without regenerating",
+            "template": "Verify that all source references exist and are accessible. Report any broken links or missing files.",
+        },
+    },
+    "categories": [
+        "index",
+        "getting_started",
+        "user_guide",
+        "developer_guides",
+        "developer",
+        "architecture",
+        "api",
+        "modules",
+        "ecosystem",
+        "showcase",
+        "community",
+    ],
+}
+
+
+# Section records. Slotted dataclasses keep hundreds of sections compact in
+# memory; orjson serializes them natively and the json fallback goes through
+# _json_default. Field order is the key order of the emitted JSON.
+@dataclass(slots=True, frozen=True)
+class Validation:
+    rules: tuple[str, ...]
+    custom_rules: tuple[str, ...]
+    acceptance_threshold: float
+
+
+@dataclass(slots=True, frozen=True)
+class Generation:
+    prompt_template: str | None
+    transform_steps: tuple[str, ...]
+    output_format: str
+    preserve_sections: tuple[str, ...]
+
+
+@dataclass(slots=True, frozen=True)
+class Metadata:
+    priority: str
+    auto_update: bool
+    last_synced: str | None
+    notes: str | None
+
+
+@dataclass(slots=True)
+class Section:
+    id: str
+    doc_path: str
+    title: str
+    category: str
+    relationship_type: str
+    sources: list[dict]
+    validation: Validation
+    generation: Generation
+    metadata: Metadata
 
 
 def generate_id(doc_path: str) -> str:
@@ -21,90 +226,68 @@ def generate_id(doc_path: str) -> str:
     docs/architecture/kernel.md -> architecture-kernel
     docs/modules/providers/anthropic.md -> modules-providers-anthropic
     """
-    # Remove 'docs/' prefix and '.md' suffix
-    path = doc_path.replace("docs/", "").replace(".md", "")
-    # Replace slashes with dashes
-    id_str = path.replace("/", "-")
-    # Handle index files
-    if id_str.endswith("-index"):
-        id_str = id_str[:-6]  # Remove '-index'
-    return id_str
+    # Remove 'docs/' prefix and '.md' suffix (no copy when absent)
+    path = doc_path.removeprefix("docs/").removesuffix(".md")
+    # Replace slashes with dashes, then drop the '-index' of index files
+    return path.replace("/", "-").removesuffix("-index")
 
 
 def extract_category(doc_path: str) -> str:
     """Extract category from doc path."""
-    parts = doc_path.replace("docs/", "").split("/")
-    if len(parts) >= 1:
-        return parts[0]
-    return "other"
+    # Categories repeat across many rows; share one str per value
+    return intern(doc_path.removeprefix("docs/").partition("/")[0])
 
 
 def extract_title(doc_path: str) -> str:
     """Extract a readable title from doc path."""
-    # Get the last part of the path (filename)
-    filename = Path(doc_path).stem
+    # Get the last part of the path (filename) without its extension
+    head, _, tail = doc_path.rpartition("/")
+    filename = tail.rsplit(".", 1)[0]
     if filename == "index":
         # Use parent directory name for index files
-        filename = Path(doc_path).parent.name
+        filename = head.rpartition("/")[2]
     # Convert to title case with spaces
     title = filename.replace("_", " ").replace("-", " ").title()
     return title
 
 
+def _parse_source(source: str) -> dict | None:
+    """Parse one stripped source entry; None if it has no repo/path split."""
+    # Format: repo-name/path/to/file.ext or repo-name/path/*.py
+    repo, sep, path = source.partition("/")
+    if not sep:
+        return None
+
+    # Determine source type
+    source_type = _EXT_TO_TYPE.get(path[path.rfind(".") :], "other")
+    if source_type == "markdown" and "README" in path:
+        source_type = "readme"
+
+    return {
+        "repo": intern(repo),
+        "path": path,
+        "type": source_type,
+        "required": True,  # Default to required
+    }
+
+
 def parse_sources(source_str: str, notes: str) -> list[dict]:
     """Parse pipe-delimited source string into array of source objects."""
     if source_str == "N/A" or not source_str:
         return []
 
-    sources = []
-    for source in source_str.split("|"):
-        source = source.strip()
-        if not source:
-            continue
-
-        # Parse repo and path
-        # Format: repo-name/path/to/file.ext or repo-name/path/*.py
-        parts = source.split("/", 1)
-        if len(parts) < 2:
-            continue
-
-        repo = parts[0]
-        path = parts[1]
-
-        # Determine source type
-        if path.endswith(".py"):
-            source_type = "python"
-        elif path.endswith(".md"):
-            if "README" in path:
-                source_type = "readme"
-            else:
-                source_type = "markdown"
-        elif path.endswith(".yaml") or path.endswith(".yml"):
-            source_type = "yaml"
-        else:
-            source_type = "other"
-
-        sources.append(
-            {
-                "repo": repo,
-                "path": path,
-                "type": source_type,
-                "required": True,  # Default to required
-            }
-        )
+    if "|" not in source_str:
+        # Single source (the common case): skip building the split list
+        source = _parse_source(source_str.strip())
+        return [source] if source else []
 
-    return sources
+    sources = (_parse_source(s.strip()) for s in source_str.split("|"))
+    return [source for source in sources if source]
 
 
-def get_validation_rules(relationship_type: str) -> list[str]:
+def get_validation_rules(relationship_type: str) -> tuple[str, ...]:
     """Get validation rules based on relationship type."""
-    rules_map = {
-        "DIRECT": ["exact_source_match", "format_consistency", "metadata_preserved"],
-        "DERIVED": ["factual_accuracy", "source_traceability", "no_hallucination"],
-        "REFERENCE": ["sources_exist", "links_valid", "refs_current"],
-        "N/A": ["build_passes", "links_valid"],
-    }
-    return rules_map.get(relationship_type, ["links_valid"])
+    return _VALIDATION_RULES.get(relationship_type, ("links_valid",))
 
 
 def get_prompt_template(relationship_type: str, category: str) -> str | None:
@@ -129,66 +312,86 @@ def get_priority(relationship_type: str, category: str) -> str:
     """Determine priority based on type and category."""
     if relationship_type == "DIRECT":
         return "high"
-    if category in ["architecture", "getting_started", "developer"]:
+    if category in _HIGH_PRIORITY_CATEGORIES:
         return "high"
-    if category in ["api", "modules"]:
+    if category in _MEDIUM_PRIORITY_CATEGORIES:
         return "medium"
     return "low"
 
 
+@functools.lru_cache(maxsize=None)
+def _section_template(
+    relationship_type: str, category: str
+) -> tuple[Validation, Generation, Metadata]:
+    """Derived section fields that depend only on (relationship type, category).
+
+    Memoized so each combination is computed once; the frozen blocks are
+    shared by every section with the same combination.
+    """
+    validation = Validation(
+        rules=get_validation_rules(relationship_type),
+        custom_rules=(),
+        acceptance_threshold=0.95 if relationship_type == "DIRECT" else 0.90,
+    )
+    generation = Generation(
+        prompt_template=get_prompt_template(relationship_type, category),
+        transform_steps=get_transform_steps(relationship_type),
+        output_format="markdown",
+        preserve_sections=("## See Also",) if relationship_type != "N/A" else ("*",),
+    )
+    metadata = Metadata(
+        priority=get_priority(relationship_type, category),
+        auto_update=relationship_type not in _NO_AUTO_UPDATE_TYPES,
+        last_synced=None,
+        notes=None,
+    )
+    return validation, generation, metadata
+
+
 def transform_csv_to_outline(csv_path: Path, output_path: Path):
     """Transform CSV mapping to JSON outline."""
 
     # Read CSV
-    sections = []
-    with open(csv_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            doc_path = row["Documentation Page"].strip()
-            source_files = row["Source Files"].strip()
-            relationship_type = row["Relationship Type"].strip()
-            notes = row.get("Notes", "").strip()
-
-            section_id = generate_id(doc_path)
+    # newline="" as the csv module requires; a 1 MiB buffer cuts read() calls
+    with open(csv_path, "r", encoding="utf-8", newline="", buffering=1 << 20) as f:
+        reader = csv.reader(f)
+        # Resolve column positions once instead of building a dict per row
+        col = {name: i for i, name in enumerate(next(reader))}
+        i_doc = col["Documentation Page"]
+        i_src = col["Source Files"]
+        i_rel = col["Relationship Type"]
+        i_notes = col.get("Notes", -1)
+
+        def make_section(row: list[str]) -> Section:
+            row = [cell.strip() for cell in row]
+            doc_path = row[i_doc]
+            source_files = row[i_src]
+            relationship_type = intern(row[i_rel])
+            notes = row[i_notes] if 0 <= i_notes < len(row) else ""
+
             category = extract_category(doc_path)
-            title = extract_title(doc_path)
-            sources = parse_sources(source_files, notes)
-
-            section = {
-                "id": section_id,
-                "doc_path": doc_path,
-                "title": title,
-                "category": category,
-                "relationship_type": relationship_type,
-                "sources": sources,
-                "validation": {
-                    "rules": get_validation_rules(relationship_type),
-                    "custom_rules": [],
-                    "acceptance_threshold": 0.95
-                    if relationship_type == "DIRECT"
-                    else 0.90,
-                },
-                "generation": {
-                    "prompt_template": get_prompt_template(relationship_type, category),
-                    "transform_steps": get_transform_steps(relationship_type),
-                    "output_format": "markdown",
-                    "preserve_sections": ["## See Also"]
-                    if relationship_type != "N/A"
-                    else ["*"],
-                },
-                "metadata": {
-                    "priority": get_priority(relationship_type, category),
-                    "auto_update": relationship_type not in ["N/A", "REFERENCE"],
-                    "last_synced": None,
-                    "notes": notes if notes else None,
-                },
-            }
-            sections.append(section)
+            validation, generation, metadata = _section_template(
+                relationship_type, category
+            )
+            return Section(
+                id=generate_id(doc_path),
+                doc_path=doc_path,
+                title=extract_title(doc_path),
+                category=category,
+                relationship_type=relationship_type,
+                sources=parse_sources(source_files, notes),
+                validation=validation,
+                generation=generation,
+                metadata=replace(metadata, notes=notes) if notes else metadata,
+            )
+
+        # Skip blank lines, as csv.DictReader did
+        sections = [make_section(row) for row in reader if row]
 
     # Derive allowed_repos from CSV source data
     all_repos: set[str] = set()
     for section in sections:
-        for source in section.get("sources", []):
+        for source in section.sources:
             repo = source.get("repo", "")
             if repo and "*" not in repo:  # Exclude glob patterns
                 all_repos.add(repo)
@@ -196,177 +399,81 @@ def transform_csv_to_outline(csv_path: Path, output_path: Path):
     # Build full outline
     outline = {
         "_meta": {
-            "name": "amplifier-docs-content-outline",
-            "version": "1.0.0",
-            "description": "Content synchronization outline for amplifier-docs",
-            "target_site": "https://microsoft.github.io/amplifier-docs/",
-            "generated_from": "docs/DOC_SOURCE_MAPPING.csv",
-            "generated_at": datetime.now(timezone.utc).isoformat(),
+            **_OUTLINE_META,
+            "generated_at": strftime("%Y-%m-%dT%H:%M:%SZ", gmtime()),
             "allowed_repos": {
                 "all": sorted(list(all_repos)),
             },
-            "github_org": "microsoft",
-            "github_base_url": "https://github.com/microsoft",
-            "relationship_types": {
-                "DIRECT": {
-                    "description": "Content closely matches source with minimal transformation",
-                    "generation_strategy": "copy_transform",
-                    "allows_enhancement": False,
-                },
-                "DERIVED": {
-                    "description": "Synthesized from sources, can enhance and adapt",
-                    "generation_strategy": "synthesize",
-                    "allows_enhancement": True,
-                },
-                "REFERENCE": {
-                    "description": "References sources for validation only, not regenerated",
-                    "generation_strategy": "validate_only",
-                    "allows_enhancement": True,
-                },
-                "N/A": {
-                    "description": "Manually maintained, skip generation",
-                    "generation_strategy": "skip",
-                    "allows_enhancement": True,
-                },
-            },
-            "validation_rule_definitions": {
-                "exact_source_match": {
-                    "description": "Core content matches source verbatim (excluding formatting)",
-                    "check": "diff_content_normalized",
-                },
-                "format_consistency": {
-                    "description": "Markdown formatting follows site standards",
-                    "check": "lint_markdown",
-                },
-                "metadata_preserved": {
-                    "description": "Source metadata preserved in output",
-                    "check": "compare_frontmatter",
-                },
-                "factual_accuracy": {
-                    "description": "All facts trace to source material",
-                    "check": "source_citation_check",
-                },
-                "source_traceability": {
-                    "description": "Each claim can be traced to specific source",
-                    "check": "traceability_analysis",
-                },
-                "no_hallucination": {
-                    "description": "No invented facts beyond sources",
-                    "check": "hallucination_detection",
-                },
-                "sources_exist": {
-                    "description": "All referenced source files exist",
-                    "check": "file_existence",
-                },
-                "links_valid": {
-                    "description": "All internal and external links resolve",
-                    "check": "link_validation",
-                },
-                "refs_current": {
-                    "description": "Referenced versions match current releases",
-                    "check": "version_comparison",
-                },
-                "build_passes": {
-                    "description": "Documentation builds without errors",
-                    "check": "mkdocs_build_strict",
-                },
-            },
-            "prompt_templates": {
-                "direct_copy": {
-                    "description": "Copy with minimal transformation",
-                    "template": "Copy the source content. Add navigation header. Update internal links to match site structure. Preserve all technical accuracy.",
-                },
-                "synthesize_architecture": {
-                    "description": "Synthesize architecture documentation",
-                    "template": "Create architecture documentation by:\n1. Extract core philosophy from design docs\n2. Analyze implementation patterns from code\n3. Synthesize into clear narrative\n4. Add diagrams where helpful\n5. Include practical examples\n\nMaintain factual accuracy - every claim must trace to sources.",
-                },
-                "synthesize_documentation": {
-                    "description": "Synthesize general documentation",
-                    "template": "Create documentation by synthesizing the source materials:\n1. Extract key concepts and information\n2. Organize in a logical structure\n3. Write clear explanations\n4. Add examples where helpful\n5. Ensure all facts trace to sources",
-                },
-                "module_reference": {
-                    "description": "Generate module reference page",
-                    "template": "Create module documentation including:\n- Purpose and capabilities\n- Installation instructions\n- Configuration options (from source)\n- Usage examples\n- API reference\n\nVerify all information against README and source code.",
-                },
-                "api_from_docstrings": {
-                    "description": "Generate API docs from Python docstrings",
-                    "template": "Extract and format API documentation from Python source:\n- Class/function signatures\n- Parameter documentation\n- Return types\n- Usage examples from docstrings\n- Cross-references to related APIs",
-                },
-                "validate_only": {
-                    "description": "Validate references without regenerating",
-                    "template": "Verify that all source references exist and are accessible. Report any broken links or missing files.",
-                },
-            },
-            "categories": [
-                "index",
-                "getting_started",
-                "user_guide",
-                "developer_guides",
-                "developer",
-                "architecture",
-                "api",
-                "modules",
-                "ecosystem",
-                "showcase",
-                "community",
-            ],
         },
         "content_sections": sections,
         "summary": {
             "total_sections": len(sections),
-            "by_relationship_type": {},
-            "by_category": {},
-            "by_priority": {},
+            "by_relationship_type": dict(
+                Counter(s.relationship_type for s in sections)
+            ),
+            "by_category": dict(Counter(s.category for s in sections)),
+            "by_priority": dict(Counter(s.metadata.priority for s in sections)),
         },
     }
 
-    # Calculate summary statistics
-    for section in sections:
-        rt = section["relationship_type"]
-        outline["summary"]["by_relationship_type"][rt] = (
-            outline["summary"]["by_relationship_type"].get(rt, 0) + 1
-        )
+    # Write output
+    write_outline(outline, output_path)
 
-        cat = section["category"]
-        outline["summary"]["by_category"][cat] = (
-            outline["summary"]["by_category"].get(cat, 0) + 1
-        )
+    print("Generated outline summary:")
+    print(_dumps(outline["summary"]).decode("utf-8"))
+    print(f"Output written to: {output_path}")
 
-        pri = section["metadata"]["priority"]
-        outline["summary"]["by_priority"][pri] = (
-            outline["summary"]["by_priority"].get(pri, 0) + 1
-        )
 
-    # Write output
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(outline, f, indent=2, ensure_ascii=False)
+def _json_default(obj):
+    """json fallback hook: serialize section dataclasses field by field."""
+    if is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
-    print(f"Generated outline with {len(sections)} sections")
-    print(f"  By relationship type: {outline['summary']['by_relationship_type']}")
-    print(f"  By category: {outline['summary']['by_category']}")
-    print(f"  By priority: {outline['summary']['by_priority']}")
-    print(f"Output written to: {output_path}")
 
+def _dumps(obj, depth: int = 0) -> bytes:
+    """Serialize obj as indent=2 JSON, re-indented to sit ``depth`` levels deep.
 
-def get_transform_steps(relationship_type: str) -> list[str]:
+    Uses orjson when available; the output is byte-identical to the json
+    fallback.
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(
+            obj, indent=2, ensure_ascii=False, default=_json_default
+        ).encode("utf-8")
+    if depth:
+        # JSON strings never contain raw newlines, so this only touches layout
+        data = data.replace(b"\n", b"\n" + b"  " * depth)
+    return data
+
+
+def write_outline(outline: dict, output_path: Path) -> None:
+    """Write the outline as indent=2 JSON, one content section at a time.
+
+    The result is identical to dumping the whole outline at once, but only
+    one serialized section is held in memory instead of the full document.
+    """
+    with open(output_path, "wb") as f:
+        f.write(b"{")
+        for i, (key, value) in enumerate(outline.items()):
+            f.write(b",\n  " if i else b"\n  ")
+            f.write(_dumps(key) + b": ")
+            if key == "content_sections" and value:
+                f.write(b"[")
+                for j, section in enumerate(value):
+                    f.write(b",\n    " if j else b"\n    ")
+                    f.write(_dumps(section, depth=2))
+                f.write(b"\n  ]")
+            else:
+                f.write(_dumps(value, depth=1))
+        f.write(b"\n}")
+
+
+def get_transform_steps(relationship_type: str) -> tuple[str, ...]:
     """Get transformation steps based on relationship type."""
-    steps_map = {
-        "DIRECT": [
-            "copy_content",
-            "add_navigation_header",
-            "update_links",
-            "add_cross_references",
-        ],
-        "DERIVED": [
-            "extract_content",
-            "synthesize_narrative",
-            "add_examples",
-            "add_navigation",
-        ],
-        "REFERENCE": ["verify_sources_exist", "validate_links", "check_version_match"],
-        "N/A": [],
-    }
-    return steps_map.get(relationship_type, [])
+    return _TRANSFORM_STEPS.get(relationship_type, ())
 
 
 if __name__ == "__main__":